@@ -3,12 +3,193 @@ import os
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QLabel, QLineEdit, QPushButton, QSlider, QColorDialog, 
                            QComboBox, QFileDialog, QMessageBox, QSpinBox,
-                           QProgressDialog)
+                           QProgressDialog, QCheckBox)
 from PySide6.QtGui import QPixmap, QImage, QColor, QFont, QFontDatabase
-from PySide6.QtCore import Qt, QByteArray
-from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageEnhance
+from PySide6.QtCore import Qt, QTimer
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
 import io
 import re
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# numba is a dev-only speed-up: it isn't in the requirements files, so the packaged app
+# never ships it and always composites with Pillow. Installing it in a source checkout
+# enables the compiled kernel in compile_composite_kernel.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Thumbnail sizes for the on-screen preview and the saved files
+PREVIEW_SIZE = (800, 450)
+OUTPUT_SIZE = (1280, 720)
+
+# Titles are simple Latin text, so skip Raqm's complex-script shaping
+try:
+    BASIC_LAYOUT = ImageFont.Layout.BASIC
+except AttributeError:  # Pillow < 9.1
+    BASIC_LAYOUT = ImageFont.LAYOUT_BASIC
+
+
+@functools.lru_cache(maxsize=32)
+def load_pil_font(font_path, size):
+    """Load a PIL font from a file path or system font name, falling back to the default font"""
+    try:
+        return ImageFont.truetype(font_path, size, layout_engine=BASIC_LAYOUT)
+    except Exception as e:
+        print(f"Error loading font {font_path}: {e}")
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=4)
+def load_pattern(filepath):
+    """Decode a pattern overlay, keeping the most recently used few in memory"""
+    return Image.open(filepath).convert("RGBA")
+
+
+def composite_with_opacity(base, pattern, opacity_q8):
+    """Blend pattern over an opaque base in place, scaling pattern alpha by opacity_q8 / 256"""
+    height, width = base.shape[:2]
+    for y in prange(height):
+        for x in range(width):
+            alpha = (pattern[y, x, 3] * opacity_q8) >> 8
+            inverse = 255 - alpha
+            for c in range(3):
+                base[y, x, c] = (pattern[y, x, c] * alpha + base[y, x, c] * inverse + 127) // 255
+            base[y, x, 3] = 255
+
+
+def compile_composite_kernel():
+    """JIT-compile composite_with_opacity, returning None if numba isn't usable"""
+    if njit is None:
+        return None
+    try:
+        kernel = njit(parallel=True, cache=True, fastmath=True)(composite_with_opacity)
+        # Warm up with the same array types _build_base passes (PIL arrays are read-only)
+        pattern = np.zeros((1, 1, 4), dtype=np.uint8)
+        pattern.setflags(write=False)
+        kernel(np.zeros((1, 1, 4), dtype=np.uint8), pattern, 256)
+        return kernel
+    except Exception as e:
+        print(f"Numba compositing unavailable: {e}")
+        return None
+
+
+def get_word_width(word, font, font_key, word_widths):
+    """Get the advance width of a word, cached in word_widths per (font, font size, word)"""
+    key = font_key + (word,)
+    width = word_widths.get(key)
+    if width is None:
+        width = font.getlength(word)
+        word_widths[key] = width
+    return width
+
+
+def wrap_text(text, font, max_width, font_key, word_widths):
+    """Wrap text to fit within max_width pixels"""
+    words = text.split()
+    if not words:
+        return []
+    
+    # Most titles fit on one line, so measure the whole thing once before packing words
+    text = ' '.join(words)
+    if font.getlength(text) <= max_width:
+        return [text]
+    
+    widths = [get_word_width(word, font, font_key, word_widths) for word in words]
+    space_width = get_word_width(' ', font, font_key, word_widths)
+    lines = []
+    current_line = []
+    current_width = 0
+    
+    for word, word_width in zip(words, widths):
+        # Try adding this word to the current line
+        test_width = current_width + space_width + word_width if current_line else word_width
+        
+        # If it's too wide, start a new line
+        if test_width > max_width and current_line:
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = word_width
+        else:
+            current_line.append(word)
+            current_width = test_width
+    
+    # Add the last line
+    if current_line:
+        lines.append(' '.join(current_line))
+    
+    return lines
+
+
+@functools.lru_cache(maxsize=64)
+def render_line_mask(line, font_path, font_size):
+    """Render a line of text into a tight coverage mask, returned with its offset from the draw origin"""
+    font = load_pil_font(font_path, font_size)
+    left, top, right, bottom = font.getbbox(line)
+    mask = Image.new("L", (max(right - left, 1), max(bottom - top, 1)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), line, font=font, fill=255)
+    return mask, left, top
+
+
+def draw_title(img, title, font, style, word_widths):
+    """Draw the title centered on img using the settings in the style dict"""
+    width, height = img.size
+    font_size = style['font_size']
+    
+    # Calculate the maximum width for text (width - margins on each side)
+    max_text_width = width - (style['text_margins'] * 2)
+    
+    # Wrap the text
+    lines = wrap_text(title, font, max_text_width,
+                                   (style['font_path'], font_size), word_widths)
+    
+    # Calculate total text height with line spacing
+    line_spacing = style['line_spacing']
+    text_height = len(lines) * (font_size + line_spacing) - line_spacing  # Remove extra spacing after last line
+    
+    # Calculate vertical position (centered)
+    y_position = (height - text_height) // 2
+    
+    # Draw each line of text
+    for line in lines:
+        # Center this line's ink horizontally; the mask spans exactly its bounding box
+        mask, left, top = render_line_mask(line, style['font_path'], font_size)
+        x_position = (width - mask.width) // 2
+        
+        # Fill the text color through the line's mask, touching only its bounding box
+        img.paste(style['text_color'], (x_position + left, y_position + top), mask)
+        
+        # Move to next line
+        y_position += font_size + line_spacing
+
+
+def encode_png(img, fast):
+    """Encode img as PNG bytes, trading file size for speed when fast is set"""
+    buffer = io.BytesIO()
+    if fast:
+        # Light zlib compression is several times faster for slightly larger files
+        img.save(buffer, format="PNG", compress_level=1, optimize=False)
+    else:
+        img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def write_file(file_path, data):
+    """Write encoded image bytes to file_path"""
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+def render_thumbnail(base, title, font, style, word_widths, fast_png):
+    """Draw the title onto a copy of base and return the encoded PNG bytes"""
+    img = base.copy()
+    draw_title(img, title, font, style, word_widths)
+    return encode_png(img, fast_png)
+
 
 class ThumbnailGenerator(QMainWindow):
     def __init__(self):
@@ -24,9 +205,27 @@ class ThumbnailGenerator(QMainWindow):
         self.current_pattern = None
         self.pattern_opacity = 100  # Full opacity by default
         self.custom_fonts = {}
-        self.pil_fonts = {}  # Store PIL font objects for different sizes
+        self.word_widths = {}  # Store measured word widths per font and size
         self.text_margins = 100  # Default margin of 100px on each side
         self.line_spacing_factor = 0.3  # Default line spacing (30% of font size)
+        # Plain copies of the font settings so rendering doesn't query the widgets
+        self.font_name = None  # Set once the font list is built
+        self.font_size = 60
+        self.line_spacing = int(self.font_size * self.line_spacing_factor)  # In pixels
+        # (width, height) -> read-only RGBA arrays, filled for the preview and output sizes
+        # whenever the background image or pattern is chosen
+        self._bg_arrays = {}
+        self._pattern_arrays = {}
+        self._base_cache = {}  # (width, height) -> (key, base image, source images)
+        
+        # Coalesce bursts of setting changes (e.g. slider drags) into one preview render
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        
+        # Compile the pattern compositing kernel up front so the first preview isn't delayed
+        self._composite_kernel = compile_composite_kernel()
         
         # Load resources
         self.load_patterns()
@@ -48,11 +247,8 @@ class ThumbnailGenerator(QMainWindow):
             
         for filename in os.listdir(patterns_dir):
             if filename.lower().endswith((".png", ".jpg", ".jpeg")):
-                filepath = os.path.join(patterns_dir, filename)
-                try:
-                    self.patterns[filename] = Image.open(filepath).convert("RGBA")
-                except Exception as e:
-                    print(f"Error loading pattern {filename}: {e}")
+                # Only remember the path; the image is decoded when it's selected
+                self.patterns[filename] = os.path.join(patterns_dir, filename)
     
     def load_custom_fonts(self):
         """Load custom fonts from the data directory"""
@@ -86,34 +282,16 @@ class ThumbnailGenerator(QMainWindow):
                 except Exception as e:
                     print(f"Error loading font {filename}: {e}")
     
+    def get_font_path(self, font_name):
+        """Get the file path for a custom font, or the name itself for system fonts"""
+        if font_name in self.custom_fonts:
+            return self.custom_fonts[font_name]['path']
+        return font_name
+    
     def get_pil_font(self, font_name, size):
         """Get a PIL font object for the given font name and size"""
-        # Create a cache key
-        key = f"{font_name}_{size}"
-        
-        # Return cached font if available
-        if key in self.pil_fonts:
-            return self.pil_fonts[key]
-        
-        try:
-            # Check if it's a custom font
-            if font_name in self.custom_fonts:
-                font_path = self.custom_fonts[font_name]['path']
-                font = ImageFont.truetype(font_path, size)
-            else:
-                # Try as system font
-                # Determine font file path based on platform
-                font = ImageFont.truetype(font_name, size)
-            
-            # Cache the font
-            self.pil_fonts[key] = font
-            return font
-        except Exception as e:
-            print(f"Error loading font {font_name}: {e}")
-            # Fall back to default font
-            default_font = ImageFont.load_default()
-            self.pil_fonts[key] = default_font
-            return default_font
+        # load_pil_font keeps a bounded cache, so slider drags don't pile up font faces
+        return load_pil_font(self.get_font_path(font_name), size)
     
     def create_ui(self):
         """Create the application UI"""
@@ -184,7 +362,8 @@ class ThumbnailGenerator(QMainWindow):
         if stratum_found:
             self.font_combo.setCurrentIndex(stratum_index)
         
-        self.font_combo.currentTextChanged.connect(self.update_preview)
+        self.font_name = self.font_combo.currentText()
+        self.font_combo.currentTextChanged.connect(self.update_font)
         controls_layout.addWidget(font_label)
         controls_layout.addWidget(self.font_combo)
         
@@ -193,8 +372,8 @@ class ThumbnailGenerator(QMainWindow):
         self.font_size_slider = QSlider(Qt.Horizontal)
         self.font_size_slider.setMinimum(10)
         self.font_size_slider.setMaximum(200)
-        self.font_size_slider.setValue(60)
-        self.font_size_slider.valueChanged.connect(self.update_preview)
+        self.font_size_slider.setValue(self.font_size)
+        self.font_size_slider.valueChanged.connect(self.update_font_size)
         controls_layout.addWidget(font_size_label)
         controls_layout.addWidget(self.font_size_slider)
         
@@ -263,6 +442,11 @@ class ThumbnailGenerator(QMainWindow):
         controls_layout.addWidget(pattern_opacity_label)
         controls_layout.addWidget(self.pattern_opacity_slider)
         
+        # PNG compression
+        self.fast_png_checkbox = QCheckBox("Fast PNG (larger file)")
+        self.fast_png_checkbox.setChecked(True)
+        controls_layout.addWidget(self.fast_png_checkbox)
+        
         # Generate and Save button
         self.save_button = QPushButton("Generate and Save Thumbnails")
         self.save_button.clicked.connect(self.save_thumbnails)
@@ -293,6 +477,17 @@ class ThumbnailGenerator(QMainWindow):
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
     
+    def update_font(self, font_name):
+        """Update the font and refresh preview"""
+        self.font_name = font_name
+        self.update_preview()
+    
+    def update_font_size(self, value):
+        """Update font size (and the line spacing derived from it) and refresh preview"""
+        self.font_size = value
+        self.line_spacing = int(value * self.line_spacing_factor)
+        self.update_preview()
+    
     def update_text_margins(self, value):
         """Update text margins and refresh preview"""
         self.text_margins = value
@@ -301,6 +496,7 @@ class ThumbnailGenerator(QMainWindow):
     def update_line_spacing(self, value):
         """Update line spacing factor and refresh preview"""
         self.line_spacing_factor = value / 100.0  # Convert to decimal percentage
+        self.line_spacing = int(self.font_size * self.line_spacing_factor)
         self.update_preview()
     
     def choose_text_color(self):
@@ -327,6 +523,9 @@ class ThumbnailGenerator(QMainWindow):
         if file_path:
             try:
                 self.background_image = Image.open(file_path).convert("RGBA")
+                self._bg_arrays = {}
+                for size in (PREVIEW_SIZE, OUTPUT_SIZE):
+                    self._bg_array(*size)
                 self.update_preview()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load image: {str(e)}")
@@ -334,14 +533,22 @@ class ThumbnailGenerator(QMainWindow):
     def clear_background_image(self):
         """Clear the background image and use color instead"""
         self.background_image = None
+        self._bg_arrays = {}
         self.update_preview()
     
     def update_overlay(self, pattern_name):
         """Update the overlay pattern"""
-        if pattern_name == "None":
+        self._pattern_arrays = {}
+        if pattern_name == "None" or pattern_name not in self.patterns:
             self.current_pattern = None
         else:
-            self.current_pattern = self.patterns.get(pattern_name)
+            try:
+                self.current_pattern = load_pattern(self.patterns[pattern_name])
+                for size in (PREVIEW_SIZE, OUTPUT_SIZE):
+                    self._pattern_array(*size)
+            except Exception as e:
+                self.current_pattern = None
+                QMessageBox.critical(self, "Error", f"Failed to load pattern: {str(e)}")
         self.update_preview()
     
     def update_pattern_opacity(self, value):
@@ -349,60 +556,82 @@ class ThumbnailGenerator(QMainWindow):
         self.pattern_opacity = value
         self.update_preview()
     
-    def wrap_text(self, text, font, max_width, draw):
-        """Wrap text to fit within max_width pixels"""
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            # Try adding this word to the current line
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
-            
-            # Get text width
-            left, top, right, bottom = draw.textbbox((0, 0), test_text, font=font)
-            text_width = right - left
-            
-            # If it's too wide, start a new line
-            if text_width > max_width and current_line:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                current_line = test_line
-        
-        # Add the last line
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines
-
-    def generate_thumbnail(self, number, width=1200, height=675):
-        """Generate the thumbnail image with the specified number"""
-        # Create base image (from background image or color)
-        if self.background_image:
+    def _bg_array(self, width, height):
+        """Return the background image fitted to width x height as a read-only RGBA array"""
+        array = self._bg_arrays.get((width, height))
+        if array is None:
             # Resize maintaining aspect ratio and crop to fit
-            img = ImageOps.fit(self.background_image, (width, height), Image.Resampling.LANCZOS)
+            array = np.array(ImageOps.fit(self.background_image, (width, height),
+                                          Image.Resampling.LANCZOS))
+            array.setflags(write=False)
+            self._bg_arrays[(width, height)] = array
+        return array
+    
+    def _pattern_array(self, width, height):
+        """Return the current pattern resized to width x height as a read-only RGBA array"""
+        array = self._pattern_arrays.get((width, height))
+        if array is None:
+            array = np.array(self.current_pattern.resize((width, height)))
+            array.setflags(write=False)
+            self._pattern_arrays[(width, height)] = array
+        return array
+    
+    def _build_base(self, width, height):
+        """Return the background with the pattern overlay applied, cached per size"""
+        bg_color = (self.background_color.red(), self.background_color.green(),
+                    self.background_color.blue())
+        key = (id(self.background_image), bg_color, id(self.current_pattern),
+               self.pattern_opacity, width, height)
+        
+        # The cache entry keeps the source images alive so their ids can't be reused
+        cached = self._base_cache.get((width, height))
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        pattern = None
+        if self.current_pattern and self.pattern_opacity > 0:
+            pattern = self._pattern_array(width, height)
+        
+        if pattern is not None and self.pattern_opacity == 100 and pattern[..., 3].min() == 255:
+            # A fully opaque pattern hides the background entirely, so just copy it
+            canvas = pattern.copy()
+        elif pattern is None and not self.background_image:
+            # Nothing to blend, so a plain RGB fill is enough
+            canvas = np.full((height, width, 3), bg_color, dtype=np.uint8)
         else:
-            # Create solid color background
-            color = (self.background_color.red(), self.background_color.green(), 
-                     self.background_color.blue(), 255)
-            img = Image.new("RGBA", (width, height), color=color)
-        
-        # Apply pattern overlay with opacity if selected
-        if self.current_pattern:
-            pattern = self.current_pattern.resize((width, height))
-            
-            # Apply opacity to pattern
-            if self.pattern_opacity < 100:
-                alpha = ImageEnhance.Brightness(pattern.split()[3])
-                alpha = alpha.enhance(self.pattern_opacity / 100)
-                r, g, b, _ = pattern.split()
-                pattern = Image.merge("RGBA", (r, g, b, alpha))
+            # Create base pixels (from background image or color)
+            if self.background_image:
+                canvas = self._bg_array(width, height).copy()
+            else:
+                canvas = np.full((height, width, 4), bg_color + (255,), dtype=np.uint8)
             
-            # Apply pattern to background
-            img = Image.alpha_composite(img, pattern)
+            # Apply pattern overlay with opacity if selected
+            if (pattern is not None and self._composite_kernel is not None
+                    and canvas[..., 3].min() == 255):
+                # Opacity and blending in one compiled pass over the opaque base
+                self._composite_kernel(canvas, pattern, self.pattern_opacity * 256 // 100)
+            elif pattern is not None:
+                # Apply opacity to pattern
+                if self.pattern_opacity < 100:
+                    # Scale the alpha channel through a lookup table in a single pass
+                    alpha_lut = (np.arange(256) * (self.pattern_opacity / 100)).astype(np.uint8)
+                    pattern = pattern.copy()
+                    pattern[..., 3] = alpha_lut[pattern[..., 3]]
+                
+                # Apply pattern to background
+                canvas = np.asarray(Image.alpha_composite(Image.fromarray(canvas, "RGBA"),
+                                                          Image.fromarray(pattern, "RGBA")))
         
+        # Text is drawn opaque, so a fully opaque base doesn't need its alpha channel
+        if canvas.shape[2] == 4 and canvas[..., 3].min() == 255:
+            canvas = canvas[..., :3]
+        img = Image.fromarray(np.ascontiguousarray(canvas))
+        
+        self._base_cache[(width, height)] = (key, img, (self.background_image, self.current_pattern))
+        return img
+    
+    def _format_titles(self, number):
+        """Return the display title and filename title for the given number"""
         # Replace # with number in title template
         title_template = self.title_input.text()
         title = title_template.replace('#', str(number))
@@ -411,64 +640,51 @@ class ThumbnailGenerator(QMainWindow):
         course_name = self.course_input.text().strip()
         
         # Use just the title for display, but include course name in filename
-        display_title = title
         filename_title = title
         if course_name:
             filename_title = f"{course_name} - {title}"
-        
-        # Add text
-        draw = ImageDraw.Draw(img)
-        
-        # Get font
-        font_name = self.font_combo.currentText()
-        font_size = self.font_size_slider.value()
-        
-        # Get appropriate font
-        font = self.get_pil_font(font_name, font_size)
-            
-        text_color = (self.text_color.red(), self.text_color.green(), 
-                      self.text_color.blue(), 255)
-        
-        # Calculate the maximum width for text (width - margins on each side)
-        max_text_width = width - (self.text_margins * 2)
-        
-        # Wrap the text - using display_title instead of full_title
-        lines = self.wrap_text(display_title, font, max_text_width, draw)
-        
-        # Calculate total text height with line spacing
-        line_spacing = int(font_size * self.line_spacing_factor)
-        text_height = len(lines) * (font_size + line_spacing) - line_spacing  # Remove extra spacing after last line
-        
-        # Calculate vertical position (centered)
-        y_position = (height - text_height) // 2
-        
-        # Draw each line of text
-        for line in lines:
-            # Center this line horizontally
-            left, top, right, bottom = draw.textbbox((0, 0), line, font=font)
-            line_width = right - left
-            x_position = (width - line_width) // 2
-            
-            # Draw the line
-            draw.text((x_position, y_position), line, font=font, fill=text_color)
-            
-            # Move to next line
-            y_position += font_size + line_spacing
-            
+        return title, filename_title
+    
+    def _text_style(self):
+        """Snapshot the text settings used by draw_title"""
+        return {
+            'font_path': self.get_font_path(self.font_name),
+            'font_size': self.font_size,
+            'text_color': (self.text_color.red(), self.text_color.green(),
+                           self.text_color.blue(), 255),
+            'text_margins': self.text_margins,
+            'line_spacing': self.line_spacing,
+        }
+    
+    def _draw_text_onto(self, img, number):
+        """Draw the title for the given number onto img and return the filename title"""
+        display_title, filename_title = self._format_titles(number)
+        font = self.get_pil_font(self.font_name, self.font_size)
+        draw_title(img, display_title, font, self._text_style(), self.word_widths)
+        return filename_title
+
+    def generate_thumbnail(self, number, width=1200, height=675):
+        """Generate the thumbnail image with the specified number"""
+        img = self._build_base(width, height).copy()
+        filename_title = self._draw_text_onto(img, number)
         return img, filename_title
     
     def update_preview(self):
+        """Schedule a preview refresh, restarting the wait if one is already pending"""
+        self._preview_timer.start()
+    
+    def _do_update_preview(self):
         """Update the preview image with the start number"""
         try:
             # Generate thumbnail at preview size with the start number
-            img, _ = self.generate_thumbnail(self.start_number.value(), 800, 450)
-            
-            # Convert PIL Image to QPixmap for display
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            buffer.seek(0)
+            img, _ = self.generate_thumbnail(self.start_number.value(), *PREVIEW_SIZE)
             
-            image = QImage.fromData(QByteArray(buffer.read()))
+            # Convert PIL Image to QPixmap by handing Qt the raw pixels (no PNG round-trip)
+            img = img.convert("RGBA")
+            data = img.tobytes("raw", "RGBA")
+            # QImage doesn't own data, so copy before the bytes go out of scope
+            image = QImage(data, img.width, img.height, img.width * 4,
+                           QImage.Format_RGBA8888).copy()
             pixmap = QPixmap.fromImage(image)
             
             self.preview_image.setPixmap(pixmap)
@@ -495,27 +711,68 @@ class ThumbnailGenerator(QMainWindow):
             progress.setWindowModality(Qt.WindowModal)
             progress.show()
             
+            # Background and pattern don't change between thumbnails, so build them once
+            # (RGB unless the background image has transparency)
+            base = self._build_base(*OUTPUT_SIZE)
+            font = self.get_pil_font(self.font_name, self.font_size)
+            style = self._text_style()
+            fast_png = self.fast_png_checkbox.isChecked()
+            
+            jobs = []
             for i in range(count):
-                # Check if user cancelled
-                if progress.wasCanceled():
-                    break
+                display_title, filename_title = self._format_titles(start_num + i)
+                file_path = os.path.join(save_dir, f"{filename_title}_Thumbnail.png")
+                jobs.append((display_title, file_path))
+            
+            if '#' not in self.title_input.text():
+                # Every thumbnail would have the same text and file name, so render it once here
+                display_title, file_path = jobs[0]
+                write_file(file_path, render_thumbnail(base, display_title, font, style,
+                                                       self.word_widths, fast_png))
+                saved = 1
+            else:
+                # Pillow releases the GIL while pasting and encoding, so threads render in
+                # parallel without the start-up cost of worker processes; a couple more
+                # threads write the files meanwhile
+                workers = min(count, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor, \
+                        ThreadPoolExecutor(max_workers=2) as io_pool:
+                    futures = {
+                        executor.submit(render_thumbnail, base, display_title, font, style,
+                                        self.word_widths, fast_png): file_path
+                        for display_title, file_path in jobs
+                    }
+                    writes = deque()
+                    saved = 0
                     
-                current_num = start_num + i
-                progress.setValue(i)
-                progress.setLabelText(f"Generating thumbnail {i+1} of {count}...")
-                
-                # Generate the thumbnail
-                img, title = self.generate_thumbnail(current_num, 1280, 720)
-                
-                # Create filename
-                filename = f"{title}_Thumbnail.png"
-                file_path = os.path.join(save_dir, filename)
-                
-                # Save the thumbnail
-                img.save(file_path)
+                    try:
+                        for done, future in enumerate(as_completed(futures)):
+                            # Check if user cancelled
+                            if progress.wasCanceled():
+                                break
+                            
+                            # Raise any error from the render, then queue the file write
+                            writes.append(io_pool.submit(write_file, futures[future], future.result()))
+                            
+                            # Keep only a few writes in flight, raising any write error
+                            while len(writes) > 4:
+                                writes.popleft().result()
+                                saved += 1
+                            
+                            progress.setValue(done + 1)
+                            progress.setLabelText(f"Generated thumbnail {done + 1} of {count}...")
+                        
+                        # Wait for the remaining writes
+                        while writes:
+                            writes.popleft().result()
+                            saved += 1
+                    finally:
+                        # After a cancel or an error, drop the renders that haven't started
+                        executor.shutdown(wait=False, cancel_futures=True)
                 
             progress.setValue(count)
-            QMessageBox.information(self, "Success", f"{count} thumbnails saved successfully!")
+            QMessageBox.information(self, "Success",
+                                    f"{saved} thumbnail{'s' if saved != 1 else ''} saved successfully!")
                 
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Failed to save thumbnails: {str(e)}")